@@ -2,7 +2,7 @@
 
 
 a = Analysis(
-    ['pyqt_main.py'],
+    ['main.py'],
     pathex=[],
     binaries=[],
     datas=[],
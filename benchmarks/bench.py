@@ -0,0 +1,217 @@
+"""Benchmarks for the GUI and engine hot paths, run headless under offscreen Qt.
+
+    python benchmarks/bench.py                    # full run, writes benchmarks/results/<commit>.json
+    python benchmarks/bench.py --quick            # sequences up to 10k steps only
+    python benchmarks/bench.py --only generate background
+    python benchmarks/bench.py compare OLD.json NEW.json
+
+Input is never injected: the engine runs against a RecordingBackend and a
+VirtualClock, so only its own per-step overhead is measured.
+"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SEQUENCE_LENGTHS = [400, 10_000, 100_000, 1_000_000]
+QUICK_SEQUENCE_LENGTHS = [400, 10_000]
+WINDOW_SIZES = [(800, 750), (1920, 1080), (2560, 1440), (3840, 2160)]
+
+def measure(func, repeats):
+    """Run `func` `repeats` times and return per-call wall times in seconds."""
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return times
+
+def repeats_for(length):
+    return 3 if length >= 100_000 else 10
+
+def make_config():
+    from engine import default_config
+    config = default_config()
+    for i, name in enumerate(("like", "bookmark", "follow")):
+        config["actions"][name] = {"type": "click", "pos": [100, 100 + 50 * i]}
+    config["settings"]["seed"] = 1
+    return config
+
+def make_sequence(length):
+    from engine import create_generator
+    return create_generator(make_config()).generate(length)
+
+def bench_generate(lengths):
+    from engine import create_generator
+    config = make_config()
+    for length in lengths:
+        generator = create_generator(config)
+        yield {"length": length}, measure(lambda: generator.generate(length), repeats_for(length))
+
+def bench_sequence_view(lengths):
+    from PyQt6.QtWidgets import QAbstractItemView
+    from main import SequenceListModel, SequenceView
+    app = qt_app()
+    for length in lengths:
+        sequence = make_sequence(length)
+        model = SequenceListModel()
+        view = SequenceView()
+        view.setModel(model)
+        view.resize(760, 400)
+        view.show()
+
+        def load():
+            model.set_sequence(sequence)
+            app.processEvents()
+        yield {"length": length, "op": "set_sequence"}, measure(load, repeats_for(length))
+
+        rows = [int(i * (length - 1) / 199) for i in range(200)]
+        def highlight():
+            for row in rows:
+                index = model.set_highlight_row(row)
+                view.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
+                app.processEvents()
+        # Reported per highlighted step
+        times = measure(highlight, 3)
+        yield {"length": length, "op": "highlight_step"}, [t / len(rows) for t in times]
+        view.close()
+
+def bench_background(sizes):
+    from main import BackgroundRenderer
+    qt_app()
+    for width, height in sizes:
+        renderer = BackgroundRenderer()
+        def uncached():
+            renderer._cache.clear()
+            renderer.pixmap(width, height)
+        yield {"width": width, "height": height, "cached": False}, measure(uncached, 5)
+        renderer.pixmap(width, height)
+        yield {"width": width, "height": height, "cached": True}, measure(lambda: renderer.pixmap(width, height), 50)
+
+def bench_config(lengths):
+    from engine import ConfigStore
+    config = make_config()
+    directory = tempfile.mkdtemp(prefix="ttwarmup-bench-")
+    try:
+        config_file = os.path.join(directory, "clicker_config.json")
+        sequence_file = os.path.join(directory, "clicker_sequence.json")
+        for length in lengths:
+            sequence = make_sequence(length)
+            store = ConfigStore(config_file, sequence_file)
+            def save():
+                store.save(config)
+                store.set_sequence(sequence)
+                store.flush()
+            yield {"length": length, "op": "save"}, measure(save, repeats_for(length))
+            def load():
+                loaded = ConfigStore(config_file, sequence_file)
+                loaded.load()
+                loaded.sequence
+            yield {"length": length, "op": "load"}, measure(load, repeats_for(length))
+    finally:
+        shutil.rmtree(directory)
+
+def bench_engine_step(lengths):
+    from simulator import simulate
+    config = make_config()
+    for length in lengths:
+        sequence = make_sequence(length)
+        times = measure(lambda: simulate(config, sequence, seed=1, countdown=0), repeats_for(length))
+        # Reported per executed step
+        yield {"length": length}, [t / length for t in times]
+
+_APP = None
+
+def qt_app():
+    global _APP
+    from PyQt6.QtWidgets import QApplication
+    _APP = QApplication.instance() or QApplication([])
+    return _APP
+
+BENCHMARKS = {
+    "generate": (bench_generate, "lengths"),
+    "sequence_view": (bench_sequence_view, "lengths"),
+    "background": (bench_background, "sizes"),
+    "config": (bench_config, "lengths"),
+    "engine_step": (bench_engine_step, "lengths"),
+}
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def run(args):
+    lengths = QUICK_SEQUENCE_LENGTHS if args.quick else SEQUENCE_LENGTHS
+    results = []
+    for name in args.only or BENCHMARKS:
+        func, scale = BENCHMARKS[name]
+        for params, times in func(lengths if scale == "lengths" else WINDOW_SIZES):
+            result = {"benchmark": name, "params": params, "repeats": len(times),
+                      "min": min(times), "median": statistics.median(times)}
+            results.append(result)
+            print(f"{name:<14} {format_params(params):<36} median {result['median'] * 1000:10.3f} ms"
+                  f"   min {result['min'] * 1000:10.3f} ms", flush=True)
+    commit = git_commit()
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    meta = {"commit": commit, "python": platform.python_version(), "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "quick": args.quick}
+    with open(output, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+    print(f"Results written to {output}")
+    return 0
+
+def format_params(params):
+    return " ".join(f"{key}={value}" for key, value in params.items())
+
+def compare(args):
+    def load(path):
+        with open(path) as f:
+            data = json.load(f)
+        return data["meta"], {(r["benchmark"], format_params(r["params"])): r for r in data["results"]}
+    old_meta, old = load(args.old)
+    new_meta, new = load(args.new)
+    print(f"{old_meta['commit']} -> {new_meta['commit']}  (median, ratio new/old; > {args.threshold:.0%} change flagged)")
+    regressions = 0
+    for key in new:
+        if key not in old:
+            continue
+        ratio = new[key]["median"] / old[key]["median"] if old[key]["median"] else float("inf")
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag, regressions = "SLOWER", regressions + 1
+        elif ratio < 1 - args.threshold:
+            flag = "faster"
+        print(f"{key[0]:<14} {key[1]:<36} {old[key]['median'] * 1000:10.3f} -> "
+              f"{new[key]['median'] * 1000:10.3f} ms  x{ratio:5.2f} {flag}")
+    return 1 if regressions else 0
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["compare"]:
+        parser = argparse.ArgumentParser(prog="bench.py compare", description="Compare two result files.")
+        parser.add_argument("old")
+        parser.add_argument("new")
+        parser.add_argument("--threshold", type=float, default=0.10, help="relative change to flag (default 0.10)")
+        return compare(parser.parse_args(argv[1:]))
+    parser = argparse.ArgumentParser(description="Benchmark the TT Warmup Auto hot paths.")
+    parser.add_argument("--quick", action="store_true", help="only sequences up to 10k steps")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="run just these benchmarks")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<commit>.json)")
+    return run(parser.parse_args(argv))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,536 @@
+"""Sequence generation and execution engine for TT Warmup Auto.
+
+Nothing in this module imports Qt, so it can be driven by the GUI in
+main.py or headlessly from headless.py. NumPy and pyautogui are only
+imported when first needed.
+"""
+import sys
+import os
+import json
+import random
+import time
+import threading
+import math
+import copy
+import tempfile
+from collections import namedtuple
+from array import array
+from itertools import groupby, repeat
+from input_backends import BACKENDS, create_backend
+from hotkeys import DEFAULT_HOTKEYS, HOTKEY_ACTIONS
+from telemetry import TELEMETRY
+
+DEFAULT_WEIGHTS = {"swipe_down": 5, "swipe_up": 70, "like": 10, "bookmark": 5, "follow": 10}
+GENERATOR_SETTINGS = ("sequence_length", "endless", "seed", "weights")
+
+def default_config() -> dict:
+    return {
+        "actions": {"like": None, "bookmark": None, "follow": None,
+            "swipe_up": {"type": "swipe", "distance": -2000, "duration": 0.2},
+            "swipe_down": {"type": "swipe", "distance": 2000, "duration": 0.2}},
+        "settings": {"random_delay": True, "delay_range": [1, 5], "sequence_length": 400,
+            "endless": False, "seed": None, "weights": dict(DEFAULT_WEIGHTS), "input_backend": "pyautogui", "executor": "thread",
+            "hotkeys": dict(DEFAULT_HOTKEYS), "telemetry": {"enabled": False, "trace_file": "ttwarmup_trace.jsonl"}}
+    }
+
+def generator_problems(config):
+    """Return a list of problems with the generator settings in `config`.
+
+    Weights are only checked for recorded actions, since those are the
+    only ones the generator draws from.
+    """
+    problems = []
+    settings = config.get("settings", {})
+    length = settings.get("sequence_length", 400)
+    if not isinstance(length, int) or isinstance(length, bool) or length < 1:
+        problems.append(f"settings.sequence_length must be a positive whole number, got {length!r}")
+    seed = settings.get("seed")
+    if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool) or seed < 0):
+        problems.append(f"settings.seed must be empty or a non-negative whole number, got {seed!r}")
+    weights = settings.get("weights", DEFAULT_WEIGHTS)
+    if not isinstance(weights, dict):
+        return problems + ["settings.weights must map action names to numbers"]
+    recorded = [a for a, d in config.get("actions", {}).items() if d is not None]
+    values = [weights.get(a, 1) for a in recorded]
+    if any(not isinstance(w, (int, float)) or isinstance(w, bool) or not w >= 0 for w in values):
+        problems.append("settings.weights must be non-negative numbers")
+    elif values and not sum(values) > 0:
+        problems.append("settings.weights must give at least one recorded action a positive weight")
+    return problems
+
+def create_generator(config):
+    """Build a generator from the configured weights, or None if actions are missing.
+
+    Raises ValueError, listing every problem, if the generator settings are invalid.
+    """
+    actions = [a for a, d in config["actions"].items() if d is not None]
+    if len(actions) < 5:
+        return None
+
+    # Fill in generator settings missing from older configs so they can be edited in the file
+    settings = config["settings"]
+    defaults = default_config()["settings"]
+    for key in GENERATOR_SETTINGS:
+        settings.setdefault(key, defaults[key])
+    problems = generator_problems(config)
+    if problems:
+        raise ValueError("\n".join(problems))
+    # Only include actions that are recorded
+    weights = {a: settings["weights"].get(a, 1) for a in actions}
+    return SequenceGenerator(weights, seed=settings["seed"])
+
+def validate_config(config, sequence):
+    """Return a list of human-readable problems with `config` and `sequence`."""
+    problems = []
+    actions = config.get("actions", {})
+    settings = config.get("settings", {})
+    for name, data in actions.items():
+        if data is None:
+            problems.append(f"Action '{name}' is not recorded")
+        elif data.get("type") == "click" and len(data.get("pos", ())) != 2:
+            problems.append(f"Action '{name}' has no valid click position")
+        elif data.get("type") == "swipe" and not (data.get("duration", 0) > 0 and "distance" in data):
+            problems.append(f"Action '{name}' needs a distance and a positive duration")
+    delay_range = settings.get("delay_range")
+    if not (isinstance(delay_range, list) and len(delay_range) == 2 and 0 <= delay_range[0] <= delay_range[1]):
+        problems.append(f"settings.delay_range must be [min, max] with 0 <= min <= max, got {delay_range!r}")
+    if settings.get("input_backend", "pyautogui") not in BACKENDS:
+        problems.append(f"settings.input_backend must be one of {', '.join(BACKENDS)}")
+    if settings.get("executor", "thread") not in ("thread", "process"):
+        problems.append("settings.executor must be 'thread' or 'process'")
+    hotkeys = settings.get("hotkeys", DEFAULT_HOTKEYS)
+    if not isinstance(hotkeys, dict) or any(not isinstance(k, str) or a not in HOTKEY_ACTIONS for k, a in hotkeys.items()):
+        problems.append(f"settings.hotkeys must map key names to one of {', '.join(HOTKEY_ACTIONS)}")
+    problems.extend(generator_problems(config))
+    if not settings.get("endless"):
+        if not len(sequence):
+            problems.append("The sequence is empty; generate one first")
+        unknown = sorted(name for name in set(sequence) if actions.get(name) is None)
+        if unknown:
+            problems.append(f"The sequence uses unknown or unrecorded actions: {', '.join(unknown)}")
+    return problems
+
+class ActionSequence:
+    """A sequence of action steps stored as ids in a compact typed array.
+
+    Action names and their display labels are interned once per distinct
+    action, so memory grows by two bytes per step and iterating yields
+    ids straight from the array without copying it. `to_json()` and
+    `from_json()` persist it run-length encoded (see `runs()`), which
+    keeps long stretches of swipes compact.
+    """
+    def __init__(self, names=()):
+        self.ids = array('H')
+        self._names = []
+        self._labels = []
+        self._name_ids = {}
+        self.extend(names)
+
+    def intern(self, name):
+        action_id = self._name_ids.get(name)
+        if action_id is None:
+            action_id = len(self._names)
+            self._names.append(name)
+            self._labels.append(self.label_for(name))
+            self._name_ids[name] = action_id
+        return action_id
+
+    @staticmethod
+    def label_for(name):
+        return name.replace("_", " ").title()
+
+    def append(self, name):
+        self.ids.append(self.intern(name))
+
+    def extend(self, names):
+        self.ids.extend(self.intern(name) for name in names)
+
+    def name_of(self, action_id):
+        return self._names[action_id]
+
+    def label_of(self, action_id):
+        return self._labels[action_id]
+
+    def label(self, index):
+        return self._labels[self.ids[index]]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        return self._names[self.ids[index]]
+
+    def __iter__(self):
+        names = self._names
+        return (names[action_id] for action_id in self.ids)
+
+    def runs(self):
+        """Yield (action_id, count) pairs for consecutive equal steps."""
+        for action_id, group in groupby(self.ids):
+            yield action_id, sum(1 for _ in group)
+
+    def to_json(self):
+        return {"names": list(self._names), "runs": [value for run in self.runs() for value in run]}
+
+    @classmethod
+    def from_json(cls, data):
+        sequence = cls(data.get("steps", ()))  # plain name list written by older versions
+        names = data.get("names", [])
+        ids = [sequence.intern(name) for name in names]
+        runs = data.get("runs", [])
+        for i in range(0, len(runs) - 1, 2):
+            sequence.ids.extend(repeat(ids[runs[i]], runs[i + 1]))
+        return sequence
+
+class SequenceGenerator:
+    """Draws weighted random actions in vectorized NumPy batches.
+
+    Passing the same `seed` reproduces the same steps. `generate()` builds
+    a fixed-length ActionSequence; `stream()` yields action ids forever,
+    drawing a new batch only when the previous one is used up.
+    """
+    def __init__(self, weights, seed=None, batch_size=4096):
+        import numpy as np
+        self.names = list(weights)
+        probabilities = np.array([weights[name] for name in self.names], dtype=np.float64)
+        self._probabilities = probabilities / probabilities.sum()
+        self._rng = np.random.default_rng(seed)
+        self.batch_size = batch_size
+
+    def new_sequence(self):
+        """Empty sequence whose action ids match the ids this generator draws."""
+        sequence = ActionSequence()
+        for name in self.names:
+            sequence.intern(name)
+        return sequence
+
+    def draw(self, count):
+        ids = self._rng.choice(len(self.names), size=count, p=self._probabilities)
+        return ids.astype("uint16")
+
+    def generate(self, length):
+        sequence = self.new_sequence()
+        for start in range(0, length, self.batch_size):
+            sequence.ids.frombytes(self.draw(min(self.batch_size, length - start)).tobytes())
+        return sequence
+
+    def stream(self):
+        while True:
+            yield from self.draw(self.batch_size).tolist()
+
+class MonotonicClock:
+    """Real time, read from time.monotonic()."""
+    @staticmethod
+    def now():
+        return time.monotonic()
+
+    @staticmethod
+    def wait(event, timeout):
+        """Wait up to `timeout` seconds; returns True if `event` was set."""
+        return event.wait(timeout)
+
+class VirtualClock:
+    """Simulated time that jumps straight to each deadline instead of sleeping."""
+    def __init__(self, start=0.0):
+        self._now = start
+
+    def now(self):
+        return self._now
+
+    def wait(self, event, timeout):
+        if event.is_set():
+            return True
+        self._now += timeout
+        return False
+
+class StepScheduler:
+    """Cancellable waits against monotonic deadlines for the automation thread.
+
+    `cancel()` wakes any pending wait immediately, so stopping never waits
+    for a polling interval. Each step wait records how late it woke up
+    relative to its target time. Time comes from `clock`, which defaults
+    to MonotonicClock; the simulator passes a VirtualClock. `cancel_event`
+    may be a multiprocessing.Event when the scheduler runs in a child process.
+    """
+    def __init__(self, clock=None, cancel_event=None):
+        self.clock = clock or MonotonicClock()
+        # A shared event is left as it is: a stop may already have been requested
+        self._cancel_event = cancel_event or threading.Event()
+        self._reset_drift()
+
+    def now(self):
+        return self.clock.now()
+
+    def reset(self):
+        self._cancel_event.clear()
+        self._reset_drift()
+
+    def _reset_drift(self):
+        self.drift_count = 0
+        self.drift_total = 0.0
+        self.drift_max = 0.0
+        self.last_drift = 0.0
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def wait_until(self, deadline):
+        """Block until the monotonic `deadline`. Returns False if cancelled."""
+        while True:
+            remaining = deadline - self.clock.now()
+            if remaining <= 0:
+                return not self.cancelled
+            if self.clock.wait(self._cancel_event, remaining):
+                return False
+
+    def wait_step(self, target):
+        """Wait for a step's target time and return the drift, or None if cancelled."""
+        if not self.wait_until(target):
+            return None
+        drift = self.clock.now() - target
+        self.last_drift = drift
+        self.drift_count += 1
+        self.drift_total += drift
+        self.drift_max = max(self.drift_max, drift)
+        if TELEMETRY.enabled:
+            TELEMETRY.record("scheduler.drift", drift)
+        return drift
+
+    def drift_summary(self):
+        return self.format_drift(self.drift_count, self.drift_total, self.drift_max)
+
+    @staticmethod
+    def format_drift(count, total, maximum):
+        if not count:
+            return ""
+        mean_ms = total / count * 1000
+        return f"Step drift: avg {mean_ms:.1f} ms, max {maximum * 1000:.1f} ms over {count} steps"
+
+class ConfigStore:
+    """Loads the config and writes it back off the GUI thread.
+
+    `save()` only snapshots the data and (re)arms a debounce timer; a
+    background thread writes once changes settle. Every write goes through
+    a temp file and `os.replace`, so an interrupted save never leaves a
+    truncated file behind. The sequence is kept in its own compact file
+    and only read the first time it is needed.
+    """
+    def __init__(self, config_file, sequence_file, debounce=0.5):
+        self.config_file = config_file
+        self.sequence_file = sequence_file
+        self.debounce = debounce
+        self._sequence = None
+        self._pending_config = None
+        self._pending_sequence = None
+        self._due = None
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._writer = None
+
+    def load(self):
+        """Return the stored config, or None if there is no usable file."""
+        config = self._read_json(self.config_file)
+        if config is None:
+            return None
+        if "sequence" in config:
+            # Migrate configs that still carry the sequence inline
+            self.set_sequence(ActionSequence(step["name"] for step in config.pop("sequence")))
+            self.save(config)
+        return config
+
+    @property
+    def sequence(self):
+        if self._sequence is None:
+            data = self._read_json(self.sequence_file)
+            self._sequence = ActionSequence.from_json(data) if data else ActionSequence()
+        return self._sequence
+
+    def set_sequence(self, sequence):
+        self._sequence = sequence
+        with self._cond:
+            self._pending_sequence = sequence
+        self._schedule()
+
+    def save(self, config):
+        snapshot = copy.deepcopy(config)
+        with self._cond:
+            self._pending_config = snapshot
+        self._schedule()
+
+    def flush(self):
+        """Write any pending changes now, on the calling thread."""
+        self._write_pending()
+
+    def _schedule(self):
+        with self._cond:
+            self._due = time.monotonic() + self.debounce
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, daemon=True)
+                self._writer.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._due is None or self._due > time.monotonic():
+                    self._cond.wait(None if self._due is None else self._due - time.monotonic())
+            self._write_pending()
+
+    def _write_pending(self):
+        # Take and write under one lock, so an older snapshot can never be written after a newer one
+        with self._write_lock:
+            with self._cond:
+                self._due = None
+                config, sequence = self._pending_config, self._pending_sequence
+                self._pending_config = self._pending_sequence = None
+            try:
+                if config is not None:
+                    self._write_atomic(self.config_file, json.dumps(config, indent=2))
+                if sequence is not None:
+                    self._write_atomic(self.sequence_file, json.dumps(sequence.to_json(), separators=(",", ":")))
+            except OSError as e:
+                print(f"Failed to save config: {e}", file=sys.stderr)
+
+    @staticmethod
+    def _write_atomic(path, text):
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def _read_json(path):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            # Keep the damaged file for inspection instead of silently overwriting it
+            os.replace(path, path + ".corrupt")
+            print(f"{path} is not valid JSON; moved it to {path}.corrupt", file=sys.stderr)
+            return None
+
+class StatusSnapshot(namedtuple("StatusSnapshot", "version phase index deadline label published")):
+    """One published worker state. `deadline` is a value of the scheduler's clock;
+    `published` is a perf_counter() stamp, set only while telemetry is on."""
+    __slots__ = ()
+
+class StatusChannel:
+    """Latest-value-wins handoff of worker state to the GUI.
+
+    The worker replaces the snapshot with a single reference assignment, so
+    publishing never blocks. The GUI pulls the newest snapshot at its own
+    frame rate and derives the countdown text locally, which keeps
+    cross-thread traffic constant however fast the steps run.
+    """
+    IDLE = "idle"
+    STARTING = "starting"
+    EXECUTING = "executing"
+    WAITING = "waiting"
+
+    def __init__(self):
+        self._snapshot = StatusSnapshot(0, self.IDLE, -1, None, "", 0.0)
+
+    def publish(self, phase, index=-1, deadline=None, label=""):
+        published = time.perf_counter() if TELEMETRY.enabled else 0.0
+        self._snapshot = StatusSnapshot(self._snapshot.version + 1, phase, index, deadline, label, published)
+
+    def snapshot(self):
+        return self._snapshot
+
+    @classmethod
+    def describe(cls, snapshot, now):
+        """Status bar text for `snapshot` at monotonic time `now`."""
+        if snapshot.phase == cls.STARTING:
+            return f"Starting in {max(1, math.ceil(snapshot.deadline - now))}..."
+        if snapshot.phase == cls.EXECUTING:
+            return f"Executing: {snapshot.label}"
+        if snapshot.phase == cls.WAITING:
+            return f"Next action in {max(0.0, snapshot.deadline - now):.1f}s"
+        return ""
+
+class AutomationEngine:
+    """Executes a sequence, publishing progress to a StatusChannel.
+
+    `run()` blocks the calling thread until the sequence is cancelled
+    through `scheduler` (or finishes, when `repeat` is False). Input goes
+    through `backend`, by default the one named by settings.input_backend,
+    created on first use. Passing a scheduler with a VirtualClock and a
+    seeded `rng` makes a run deterministic and instant; `on_step`, if given,
+    is called as on_step(index, name, started, target) after each action.
+    """
+    def __init__(self, config, backend=None, scheduler=None, rng=None, on_step=None):
+        self.config = config
+        self._backend = backend
+        self.scheduler = scheduler or StepScheduler()
+        self.status_channel = StatusChannel()
+        self.rng = rng or random.Random()
+        self.on_step = on_step
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = create_backend(self.config["settings"].get("input_backend", "pyautogui"))
+        return self._backend
+
+    def execute_action(self, name):
+        backend = self.backend
+        action_details = self.config["actions"][name]
+        action_type = action_details["type"]
+        if action_type == "click":
+            pos = action_details["pos"]
+            backend.click(pos[0], pos[1])
+        elif action_type == "scroll":
+            backend.scroll(action_details["amount"])
+        elif action_type == "swipe":
+            # To simulate a continuous trackpad swipe, we send a stream of small scroll events.
+            distance = action_details["distance"] # Total scroll amount (negative for up, positive for down)
+            duration = action_details["duration"] # How long the swipe should take
+            backend.swipe(distance, duration, self.scheduler)
+
+    def run(self, sequence, generator=None, repeat=True, countdown=3):
+        scheduler = self.scheduler
+        channel = self.status_channel
+        start_deadline = scheduler.now() + countdown
+        channel.publish(StatusChannel.STARTING, deadline=start_deadline)
+        scheduler.wait_until(start_deadline)
+        
+        if generator is not None:
+            # Endless mode: steps are drawn as they are consumed and never shown in the list
+            sequence = generator.new_sequence()
+            steps = generator.stream()
+        else:
+            # Generating a new sequence replaces the object, so iterating this one needs no copy
+            steps = sequence.ids
+        delay_range = self.config["settings"]["delay_range"]
+        
+        while not scheduler.cancelled:
+            for idx, action_id in enumerate(steps):
+                if scheduler.cancelled: break
+                row = -1 if generator is not None else idx
+                name = sequence.name_of(action_id)
+                started = scheduler.now()
+                channel.publish(StatusChannel.EXECUTING, row, label=sequence.label_of(action_id))
+                action_started = time.perf_counter() if TELEMETRY.enabled else None
+                self.execute_action(name)
+                if action_started is not None:
+                    TELEMETRY.record(f"action.{name}", time.perf_counter() - action_started, index=idx)
+                target = scheduler.now() + self.rng.uniform(*delay_range)
+                channel.publish(StatusChannel.WAITING, row, deadline=target)
+                if self.on_step:
+                    self.on_step(idx, name, started, target)
+                if scheduler.wait_step(target) is None: break
+            if not repeat: break
+        channel.publish(StatusChannel.IDLE)
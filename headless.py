@@ -0,0 +1,139 @@
+"""Headless entry point: validate or run a config without creating a QApplication.
+
+    python headless.py validate
+    python headless.py run --once
+    python headless.py simulate --seed 1
+"""
+import time
+_STARTED_AT = time.perf_counter()
+import sys
+import json
+import argparse
+import threading
+from input_backends import BACKENDS, create_backend
+from engine import ActionSequence, AutomationEngine, ConfigStore, create_generator, validate_config
+from telemetry import TELEMETRY, format_summary, summarize_trace
+
+def load(args):
+    store = ConfigStore(args.config, args.sequence)
+    config = store.load()
+    if config is None:
+        print(f"No usable config at {args.config}", file=sys.stderr)
+        sys.exit(2)
+    # Write out an inline-sequence migration now; this process may not live past the debounce
+    store.flush()
+    if args.telemetry or args.trace:
+        TELEMETRY.enable(args.trace)
+    else:
+        TELEMETRY.configure(config["settings"].get("telemetry"))
+    if args.timing:
+        store.sequence  # include the lazy sequence read in the measurement
+        print(f"Startup: imports {(args.imported_at - _STARTED_AT) * 1000:.0f} ms, "
+              f"config loaded {(time.perf_counter() - _STARTED_AT) * 1000:.0f} ms", file=sys.stderr)
+    return store, config
+
+def validate(args):
+    store, config = load(args)
+    problems = validate_config(config, store.sequence)
+    for problem in problems:
+        print(f"error: {problem}")
+    if not problems:
+        mode = "endless" if config["settings"].get("endless") else f"{len(store.sequence)} steps"
+        print(f"{args.config}: OK ({mode})")
+    return 1 if problems else 0
+
+def run(args):
+    store, config = load(args)
+    problems = validate_config(config, store.sequence)
+    if problems:
+        for problem in problems:
+            print(f"error: {problem}", file=sys.stderr)
+        return 1
+    generator = create_generator(config) if config["settings"].get("endless") else None
+    backend = None
+    if args.backend:
+        # The null backend prints what it would inject instead of touching the mouse
+        backend = create_backend(args.backend, **({"log": print} if args.backend == "null" else {}))
+
+    def on_step(index, name, started, target):
+        # Called by the engine after every action, so even instant clicks are listed
+        print(f"[{index}] {ActionSequence.label_for(name)}", flush=True)
+
+    engine = AutomationEngine(config, backend, on_step=on_step)
+    worker = threading.Thread(target=engine.run, args=(store.sequence, generator, not args.once, args.countdown), daemon=True)
+    worker.start()
+    try:
+        while worker.is_alive():
+            worker.join(0.05)
+    except KeyboardInterrupt:
+        engine.scheduler.cancel()
+        worker.join()
+    drift = engine.scheduler.drift_summary()
+    print(f"Automation stopped. {drift}" if drift else "Automation stopped.")
+    report_telemetry()
+    return 0
+
+def simulate(args):
+    from simulator import simulate as simulate_run
+    store, config = load(args)
+    problems = validate_config(config, store.sequence)
+    if problems:
+        for problem in problems:
+            print(f"error: {problem}", file=sys.stderr)
+        return 1
+    endless = config["settings"].get("endless")
+    generator = create_generator(config) if endless else None
+    max_steps = args.steps or (1000 if endless else None)
+    seed = args.seed if args.seed is not None else config["settings"].get("seed")
+    started = time.perf_counter()
+    report = simulate_run(config, store.sequence, generator, seed=seed, max_steps=max_steps)
+    elapsed = time.perf_counter() - started
+    if args.json:
+        print(json.dumps({"summary": report.summary(), "timeline": [step._asdict() for step in report.timeline]}))
+        return 0
+    if args.timeline:
+        for step in report.timeline:
+            print(f"{step.start:10.2f}s  [{step.index}] {step.name:<12} action {step.action_time:.2f}s  delay {step.delay:.2f}s")
+    print(report.format_summary())
+    print(f"Simulated in {elapsed * 1000:.0f} ms")
+    report_telemetry()
+    return 0
+
+def telemetry(args):
+    print(format_summary(summarize_trace(args.trace_file)))
+    return 0
+
+def report_telemetry():
+    if TELEMETRY.enabled:
+        print(format_summary(TELEMETRY.summary()))
+        TELEMETRY.disable()
+
+def main(argv=None):
+    imported_at = time.perf_counter()
+    parser = argparse.ArgumentParser(description="Run TT Warmup Auto without the GUI.")
+    parser.add_argument("--config", default="clicker_config.json")
+    parser.add_argument("--sequence", default="clicker_sequence.json")
+    parser.add_argument("--timing", action="store_true", help="report startup time on stderr")
+    parser.add_argument("--telemetry", action="store_true", help="collect latency telemetry and print a summary")
+    parser.add_argument("--trace", help="also write telemetry samples to this JSONL file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("validate", help="check the config and sequence and exit")
+    run_parser = commands.add_parser("run", help="execute the sequence until Ctrl+C")
+    run_parser.add_argument("--once", action="store_true", help="stop after one pass over the sequence")
+    run_parser.add_argument("--backend", choices=sorted(BACKENDS), help="override settings.input_backend")
+    run_parser.add_argument("--countdown", type=float, default=3, help="seconds to wait before the first step")
+    simulate_parser = commands.add_parser("simulate", help="replay one pass in virtual time and print statistics")
+    simulate_parser.add_argument("--seed", type=int, help="seed for the step delays (default: settings.seed)")
+    simulate_parser.add_argument("--steps", type=int, help="stop after this many steps (default: one pass, or 1000 when endless)")
+    simulate_parser.add_argument("--timeline", action="store_true", help="print every step")
+    simulate_parser.add_argument("--json", action="store_true", help="print the summary and timeline as JSON")
+    telemetry_parser = commands.add_parser("telemetry", help="summarize a telemetry trace file")
+    telemetry_parser.add_argument("trace_file", nargs="?", default="ttwarmup_trace.jsonl")
+    args = parser.parse_args(argv)
+    args.imported_at = imported_at
+
+    command = {"validate": validate, "run": run, "simulate": simulate, "telemetry": telemetry}[args.command]
+    return command(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
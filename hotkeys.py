@@ -0,0 +1,91 @@
+"""Global hotkeys from the binding table in settings.hotkeys.
+
+The pynput hook runs for every key pressed anywhere on the system, so
+bindings are compiled into lookup tables once, up front. Per keystroke
+the hook does one dictionary lookup and, on a match, one put on a
+non-blocking queue. A single dispatch thread drains the queue and hands
+each action to the handler, so every hotkey action takes the same path
+whatever the app is doing.
+"""
+import time
+import queue
+import threading
+from telemetry import TELEMETRY
+
+DEFAULT_HOTKEYS = {"esc": "stop", "q": "stop"}
+HOTKEY_ACTIONS = ("stop",)
+
+def compile_bindings(bindings, keyboard):
+    """Split `bindings` into special-key and character lookup tables.
+
+    Keys are pynput Key names ("esc", "f8", ...) or single characters;
+    letters match regardless of Shift. Returns (keys, chars, unknown)
+    where `unknown` lists the key names that could not be matched.
+    """
+    keys, chars, unknown = {}, {}, []
+    for name, action in bindings.items():
+        if name in keyboard.Key.__members__:
+            keys[keyboard.Key[name]] = action
+        elif len(name) == 1:
+            chars[name.lower()] = chars[name.upper()] = action
+        else:
+            unknown.append(name)
+    return keys, chars, unknown
+
+class HotkeyListener:
+    """Turns global key presses into actions for `handler(action)`.
+
+    `handler` runs on the dispatch thread, not the GUI thread, so it must
+    only do thread-safe work or forward to the GUI itself.
+    """
+    def __init__(self, bindings, handler):
+        self.bindings = dict(bindings)
+        self.handler = handler
+        self.unknown = []
+        self._queue = queue.SimpleQueue()
+        self._listener = None
+        self._dispatcher = None
+
+    def start(self):
+        from pynput import keyboard
+        keys, chars, self.unknown = compile_bindings(self.bindings, keyboard)
+        self._dispatcher = threading.Thread(target=self._dispatch, name="hotkey-dispatch", daemon=True)
+        self._dispatcher.start()
+        self._listener = keyboard.Listener(on_press=self._matcher(keys, chars, keyboard.Key), daemon=True)
+        self._listener.start()
+
+    def _matcher(self, keys, chars, key_type):
+        put = self._queue.put_nowait
+        match_key = keys.get
+        match_char = chars.get
+
+        def on_press(key):
+            # A slow hook holds up typing in every app, so this is only bound lookups and a put
+            char = getattr(key, "char", None)
+            if char is not None:
+                action = match_char(char)
+            elif type(key) is key_type:
+                action = match_key(key)
+            else:
+                return
+            if action is not None:
+                put((action, time.perf_counter()))
+        return on_press
+
+    def _dispatch(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            action, pressed = item
+            if TELEMETRY.enabled:
+                TELEMETRY.record("hotkey.dispatch", time.perf_counter() - pressed, action=action)
+            self.handler(action)
+
+    def stop(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._dispatcher is not None:
+            self._queue.put(None)
+            self._dispatcher = None
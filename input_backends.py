@@ -0,0 +1,130 @@
+"""Input backends that inject the mouse events the engine asks for.
+
+Backends only know how to click and scroll; `swipe()` splits a gesture
+into scroll steps and times them against monotonic deadlines, so every
+backend keeps to the configured duration. The backing library of each
+backend is imported when the backend is created, not at module load.
+"""
+import sys
+import time
+from collections import deque
+
+class InputBackend:
+    """Base class for input backends."""
+    name = None
+
+    def click(self, x, y):
+        raise NotImplementedError
+
+    def scroll(self, amount):
+        raise NotImplementedError
+
+    def swipe(self, distance, duration, scheduler, step_interval=0.05):
+        """Scroll `distance` in even steps spread over `duration` seconds.
+
+        Steps are timed with `scheduler.wait_until()` against the scheduler's
+        clock; a cancelled run aborts the swipe and returns False.
+        """
+        num_steps = max(1, int(duration / step_interval))
+        start = scheduler.now()
+        sent = 0
+        for i in range(1, num_steps + 1):
+            # Round the running total so the steps always add up to `distance`
+            target = round(distance * i / num_steps)
+            self.scroll(target - sent)
+            sent = target
+            if not scheduler.wait_until(start + duration * i / num_steps):
+                return False
+        return True
+
+class PyAutoGuiBackend(InputBackend):
+    """Injects input through pyautogui, skipping its per-call PAUSE."""
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def click(self, x, y):
+        self._pyautogui.click(x, y, _pause=False)
+
+    def scroll(self, amount):
+        self._pyautogui.scroll(amount, _pause=False)
+
+class PynputBackend(InputBackend):
+    """Injects input through a pynput mouse controller.
+
+    Scroll amounts are in pyautogui's units, so a swipe `distance` means
+    the same on either backend. They are converted to pynput's units for
+    the platform, carrying the rounding remainder from one scroll to the
+    next so a swipe's total is kept.
+    """
+    name = "pynput"
+
+    def __init__(self):
+        from pynput.mouse import Button, Controller
+        self._button = Button.left
+        self._mouse = Controller()
+        self._scale = self.scroll_scale()
+        self._carry = 0.0
+
+    @staticmethod
+    def scroll_scale(platform=sys.platform):
+        """pynput scroll units per pyautogui scroll unit on `platform`."""
+        if platform == "win32":
+            # pyautogui sends raw wheel data; pynput multiplies by WHEEL_DELTA (120)
+            return 1 / 120
+        if platform == "darwin":
+            # pyautogui scrolls by lines, pynput by pixels
+            try:
+                import Quartz
+                source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
+                return Quartz.CGEventSourceGetPixelsPerLine(source) or 10.0
+            except Exception:
+                return 10.0
+        # X11: both send one wheel button click per unit
+        return 1
+
+    def click(self, x, y):
+        self._mouse.position = (x, y)
+        self._mouse.click(self._button)
+
+    def scroll(self, amount):
+        exact = amount * self._scale + self._carry
+        steps = round(exact)
+        self._carry = exact - steps
+        if steps:
+            self._mouse.scroll(0, steps)
+
+class RecordingBackend(InputBackend):
+    """Injects nothing; records each event it would have sent.
+
+    Events are (time, kind, args) tuples, timed by `clock` (monotonic by
+    default). `max_events` bounds memory for long runs, and `log` is
+    called with a readable line per event when given.
+    """
+    name = "null"
+
+    def __init__(self, max_events=10000, log=None, clock=time.monotonic):
+        self.events = deque(maxlen=max_events)
+        self.log = log
+        self.clock = clock
+
+    def _record(self, kind, *args):
+        event = (self.clock(), kind, args)
+        self.events.append(event)
+        if self.log:
+            self.log(f"{event[0]:.3f} {kind} {' '.join(map(str, args))}")
+
+    def click(self, x, y):
+        self._record("click", x, y)
+
+    def scroll(self, amount):
+        self._record("scroll", amount)
+
+BACKENDS = {backend.name: backend for backend in (PyAutoGuiBackend, PynputBackend, RecordingBackend)}
+
+def create_backend(name, **kwargs):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown input backend {name!r}; expected one of {', '.join(BACKENDS)}")
+    return BACKENDS[name](**kwargs)
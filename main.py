@@ -1,25 +1,26 @@
+import time
+_STARTED_AT = time.perf_counter()
 import sys
 import os
-import json
-import random
-import time
 import threading
+from collections import OrderedDict
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QLabel,
-                             QGridLayout, QGroupBox, QTextEdit, QMessageBox, QHBoxLayout)
-from PyQt6.QtGui import QPixmap, QImage, QFont, QPainter, QPen, QPainterPath
-from PyQt6.QtCore import Qt, QObject, pyqtSignal, QTimer
-import numpy as np
-import pyautogui
-from pynput import mouse, keyboard
-from pynput.mouse import Button, Controller as MouseController
-from PIL import Image, ImageDraw
-from PIL.ImageQt import ImageQt
+                             QGridLayout, QGroupBox, QTableView, QHeaderView, QMessageBox, QHBoxLayout,
+                             QAbstractItemView)
+from PyQt6.QtGui import (QPixmap, QImage, QFont, QPainter, QPen, QPainterPath, QColor, QBrush,
+                         QLinearGradient, QShortcut, QKeySequence)
+from PyQt6.QtCore import Qt, QObject, pyqtSignal, QTimer, QAbstractListModel, QModelIndex
+from engine import (ActionSequence, AutomationEngine, ConfigStore, StatusChannel,
+                    create_generator, default_config, validate_config)
+from telemetry import TELEMETRY, format_summary
+from hotkeys import DEFAULT_HOTKEYS, HotkeyListener
 
 # --- Accessibility permission check for macOS ---
 def check_accessibility_permission():
     import platform
     if platform.system() != "Darwin":
         return True  # Only check on macOS
+    import pyautogui
     try:
         current_pos = pyautogui.position()
         pyautogui.moveTo(current_pos[0], current_pos[1], duration=0.1)
@@ -57,12 +58,194 @@ class CountdownLabel(QLabel):
         painter.setPen(Qt.GlobalColor.white)
         painter.fillPath(path, Qt.GlobalColor.white)
 
+class BackgroundRenderer:
+    """Renders the gradient-noise window background with whole-array NumPy ops.
+
+    The noise is generated once as a small tile and tiled to the requested
+    size, and pixmaps for the most recent sizes are kept in an LRU cache.
+    """
+    TOP_COLOR = (245, 240, 235)
+    BOTTOM_COLOR = (235, 230, 225)
+    NOISE_ALPHA = 0.03
+    TILE_SIZE = 256
+
+    def __init__(self, cache_size=4):
+        import numpy as np
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        # Same wrapped-around Gaussian noise as before, pre-scaled by its blend weight
+        noise = np.random.normal(0, 4, (self.TILE_SIZE, self.TILE_SIZE, 3)).astype(np.uint8)
+        self._noise_tile = noise.astype(np.float32) * self.NOISE_ALPHA
+
+    def pixmap(self, width, height):
+        key = (width, height)
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self._cache.move_to_end(key)
+            return pixmap
+        pixmap = QPixmap.fromImage(self.render_image(width, height))
+        self._cache[key] = pixmap
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return pixmap
+
+    @classmethod
+    def gradient_pixmap(cls, width, height):
+        """The background without its noise, drawn by Qt so no NumPy is needed."""
+        pixmap = QPixmap(width, height)
+        gradient = QLinearGradient(0, 0, 0, height)
+        gradient.setColorAt(0, QColor(*cls.TOP_COLOR))
+        gradient.setColorAt(1, QColor(*cls.BOTTOM_COLOR))
+        painter = QPainter(pixmap)
+        painter.fillRect(pixmap.rect(), gradient)
+        painter.end()
+        return pixmap
+
+    def render(self, width, height):
+        """Return the background as a (height, width, 3) uint8 array."""
+        import numpy as np
+        ratio = (np.arange(height, dtype=np.float32) / height)[:, None]
+        top = np.array(self.TOP_COLOR, dtype=np.float32)
+        bottom = np.array(self.BOTTOM_COLOR, dtype=np.float32)
+        gradient = np.floor(top * (1 - ratio) + bottom * ratio) * (1 - self.NOISE_ALPHA)
+        reps = (-(-height // self.TILE_SIZE), -(-width // self.TILE_SIZE), 1)
+        noise = np.tile(self._noise_tile, reps)[:height, :width]
+        return (noise + gradient[:, None, :]).astype(np.uint8)
+
+    def render_image(self, width, height):
+        pixels = self.render(width, height)
+        image = QImage(pixels.data, width, height, 3 * width, QImage.Format.Format_RGB888)
+        # QImage does not own the NumPy buffer, so detach before it is freed
+        return image.copy()
+
+class SequenceListModel(QAbstractListModel):
+    """List model for the sequence box. Rows are rendered lazily by the view,
+    so highlighting a step only repaints the previous and the new row."""
+    HIGHLIGHT_BRUSH = QBrush(QColor("#cce6ff"))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sequence = ActionSequence()
+        self._highlight_row = -1
+
+    def set_sequence(self, sequence):
+        self.beginResetModel()
+        self._sequence = sequence
+        self._highlight_row = -1
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._sequence)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            label = self._sequence.label(row)
+            return f"→ {label}" if row == self._highlight_row else label
+        if role == Qt.ItemDataRole.BackgroundRole and row == self._highlight_row:
+            return self.HIGHLIGHT_BRUSH
+        return None
+
+    def set_highlight_row(self, row):
+        """Move the highlight to `row` (-1 clears it) and return its index."""
+        if not 0 <= row < len(self._sequence):
+            row = -1
+        previous = self._highlight_row
+        if row == previous:
+            return self.index(row) if row >= 0 else QModelIndex()
+        self._highlight_row = row
+        roles = [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.BackgroundRole]
+        if previous >= 0:
+            prev_index = self.index(previous)
+            self.dataChanged.emit(prev_index, prev_index, roles)
+        if row < 0:
+            return QModelIndex()
+        new_index = self.index(row)
+        self.dataChanged.emit(new_index, new_index, roles)
+        return new_index
+
+class SequenceView(QTableView):
+    """Single-column, list-styled view for SequenceListModel.
+
+    QListView re-lays out every row on any dataChanged, which makes each
+    highlight O(n). A table with fixed-height rows positions rows
+    arithmetically, so loading and highlighting stay constant-time.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        rows = self.verticalHeader()
+        rows.hide()
+        rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        rows.setDefaultSectionSize(self.fontMetrics().height() + 4)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+class CursorTracker(QObject):
+    """Pushes global cursor positions to subscribers from a pynput mouse listener.
+
+    The listener only runs while something is subscribed. Moves are
+    coalesced: the listener thread just stores the latest position and
+    queues at most one delivery to the GUI thread at a time.
+    """
+    _moved = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._subscribers = []
+        self._listener = None
+        self._delivery_pending = False
+        self.position = None
+        self._moved.connect(self._deliver)
+
+    def subscribe(self, callback):
+        if callback in self._subscribers:
+            return
+        self._subscribers.append(callback)
+        if self._listener is None:
+            from pynput import mouse
+            x, y = mouse.Controller().position
+            self.position = (int(x), int(y))
+            self._listener = mouse.Listener(on_move=self._on_move, daemon=True)
+            self._listener.start()
+        callback(self.position)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+        if not self._subscribers:
+            self.stop()
+
+    def stop(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _on_move(self, x, y):
+        # Runs on the listener thread for every mouse move, so keep it minimal
+        self.position = (int(x), int(y))
+        if not self._delivery_pending:
+            self._delivery_pending = True
+            self._moved.emit()
+
+    def _deliver(self):
+        self._delivery_pending = False
+        pos = self.position
+        for callback in list(self._subscribers):
+            callback(pos)
+
 # Worker signals must be a QObject
 class WorkerSignals(QObject):
-    update_status = pyqtSignal(str)
     automation_finished = pyqtSignal()
-    cancel_recording_signal = pyqtSignal()
-    highlight_sequence_step = pyqtSignal(int)
+    hotkey = pyqtSignal(str)
 
 class SkeuomorphicWindow(QMainWindow):
     def __init__(self):
@@ -70,35 +253,72 @@ class SkeuomorphicWindow(QMainWindow):
 
         # Core application logic initialization
         self.config_file = "clicker_config.json"
+        self.sequence_file = "clicker_sequence.json"
+        self.config_store = ConfigStore(self.config_file, self.sequence_file)
         self.config = self.load_config()
+        self.engine = AutomationEngine(self.config)
+        self.process_runner = None  # set while automation runs in a child process
+        self.status_source = self.engine.status_channel
+        TELEMETRY.configure(self.config["settings"].get("telemetry"))
         self.is_running = False
         self.thread = None
-        self.esc_pressed = False
+        self.last_status_version = -1
+        self.automation_error = None
         self.recording_action = None
         self.countdown_label = None # For the on-cursor countdown
-        self.mouse_controller = MouseController()
-        
-        # Setup keyboard listener for stopping automation
-        self.keyboard_listener = keyboard.Listener(on_press=self.on_press, daemon=True)
-        self.keyboard_listener.start()
+        self.cursor_tracker = CursorTracker(self)
+        self.hotkeys = None
 
         self.signals = WorkerSignals()
-        self.signals.update_status.connect(self.update_status_label)
         self.signals.automation_finished.connect(self.on_automation_finished)
-        self.signals.cancel_recording_signal.connect(self.cancel_recording)
-        self.signals.highlight_sequence_step.connect(self.update_sequence_list)
+        self.signals.hotkey.connect(self.on_hotkey)
 
         self.setWindowTitle("TT Warmup Auto")
         self.setGeometry(100, 100, 800, 750)
 
+        # Pulls worker state at a fixed frame rate while automation runs
+        self.status_timer = QTimer(self)
+        self.status_timer.setInterval(33)
+        self.status_timer.timeout.connect(self.poll_status)
+
+        # Telemetry can be switched on and inspected while the app runs
+        QShortcut(QKeySequence("Ctrl+Shift+T"), self, self.toggle_telemetry)
+        QShortcut(QKeySequence("Ctrl+Shift+I"), self, self.show_telemetry_summary)
+
         self.setup_ui()
         self.update_action_labels()
-        self.update_sequence_list()
+        # The keyboard hook, cursor tracking and the sequence file are only set up once the window is up
+        QTimer.singleShot(0, self.start_hotkeys)
+        QTimer.singleShot(0, self.start_cursor_tracking)
+        QTimer.singleShot(0, self.update_sequence_list)
+
+    def start_cursor_tracking(self):
+        if not self.is_running:
+            self.cursor_tracker.subscribe(self.update_coordinates)
+
+    def start_hotkeys(self):
+        settings = self.config["settings"]
+        if "hotkeys" not in settings:
+            # Write the default bindings out so there is a table in clicker_config.json to edit
+            settings["hotkeys"] = dict(DEFAULT_HOTKEYS)
+            self.save_config()
+        bindings = settings["hotkeys"]
+        # Every action reaches on_hotkey on the GUI thread through one queued signal
+        self.hotkeys = HotkeyListener(bindings, self.signals.hotkey.emit)
+        self.hotkeys.start()
+        if self.hotkeys.unknown:
+            self.update_status_label(f"Ignoring unknown hotkeys: {', '.join(self.hotkeys.unknown)}")
     
     def setup_ui(self):
         # Background
         self.background_label = QLabel(self)
-        self.create_gradient_noise_background()
+        # Stretch the current pixmap while resizing; a fresh one is rendered once the size settles
+        self.background_label.setScaledContents(True)
+        self.background_renderer = None  # created on first render, which keeps NumPy off the startup path
+        self.background_timer = QTimer(self)
+        self.background_timer.setSingleShot(True)
+        self.background_timer.setInterval(120)
+        self.background_timer.timeout.connect(self.create_gradient_noise_background)
 
         # Main widget and layout
         central_widget = QWidget()
@@ -169,12 +389,6 @@ class SkeuomorphicWindow(QMainWindow):
         top_info_layout.addWidget(self.status_label, alignment=Qt.AlignmentFlag.AlignRight)
         main_layout.addWidget(self.top_info_widget)
 
-        # Timer to update mouse coordinates
-        self.coord_timer = QTimer(self)
-        self.coord_timer.setInterval(100)
-        self.coord_timer.timeout.connect(self.update_coordinates)
-        self.coord_timer.start()
-
         # --- Recording Box ---
         self.recording_box = QGroupBox("Record Actions")
         self.recording_box.setStyleSheet(group_box_style)
@@ -214,15 +428,16 @@ class SkeuomorphicWindow(QMainWindow):
         self.sequence_box = QGroupBox("Current Sequence")
         self.sequence_box.setStyleSheet(group_box_style)
         sequence_layout = QVBoxLayout(self.sequence_box)
-        self.sequence_text = QTextEdit()
-        self.sequence_text.setReadOnly(True)
-        self.sequence_text.setStyleSheet("""
+        self.sequence_model = SequenceListModel(self)
+        self.sequence_view = SequenceView()
+        self.sequence_view.setModel(self.sequence_model)
+        self.sequence_view.setStyleSheet("""
             background-color: rgba(255, 255, 255, 0.85);
             border-radius: 10px;
             color: black;
             font-size: 12px;
         """)
-        sequence_layout.addWidget(self.sequence_text)
+        sequence_layout.addWidget(self.sequence_view)
         main_layout.addWidget(self.sequence_box)
 
         # --- Stop Button (fixed position, always in main layout) ---
@@ -232,25 +447,19 @@ class SkeuomorphicWindow(QMainWindow):
         self.stop_button.setVisible(False)
         main_layout.addWidget(self.stop_button)
 
-        self.show_setup_view() # Set initial UI state
+        self.show_setup_view(track_cursor=False) # Set initial UI state; cursor tracking starts once shown
 
-    def on_press(self, key):
-        try:
-            if key == keyboard.Key.esc or key == keyboard.KeyCode.from_char('q'):
-                if self.is_running:
-                    self.esc_pressed = True
-                    self.stop_automation()
-                elif self.recording_action is not None:
-                    # Emit signal to safely interact with GUI from listener thread
-                    self.signals.cancel_recording_signal.emit()
-        except AttributeError:
-            pass
+    def on_hotkey(self, action):
+        if action == "stop":
+            if self.is_running:
+                self.stop_automation()
+            elif self.recording_action is not None:
+                self.cancel_recording()
 
     def cancel_recording(self):
         if hasattr(self, 'record_timer') and self.record_timer.isActive():
             self.record_timer.stop()
-        if hasattr(self, 'position_timer') and self.position_timer.isActive():
-            self.position_timer.stop()
+        self.cursor_tracker.unsubscribe(self.update_cursor_widget_position)
         if self.countdown_label:
             self.countdown_label.hide()
             
@@ -275,15 +484,12 @@ class SkeuomorphicWindow(QMainWindow):
         if not self.countdown_label:
             self.countdown_label = CountdownLabel()
         self.countdown_label.setText(str(self.countdown))
+        self.cursor_tracker.subscribe(self.update_cursor_widget_position)
         self.countdown_label.show()
         self.record_timer = QTimer(self)
         self.record_timer.setInterval(1000)
         self.record_timer.timeout.connect(self.record_countdown_tick)
         self.record_timer.start()
-        self.position_timer = QTimer(self)
-        self.position_timer.setInterval(16)
-        self.position_timer.timeout.connect(self.update_cursor_widget_position)
-        self.position_timer.start()
 
     def record_countdown_tick(self):
         self.countdown -= 1
@@ -291,16 +497,14 @@ class SkeuomorphicWindow(QMainWindow):
         
         if self.countdown <= 0:
             self.record_timer.stop()
-            self.position_timer.stop()
+            self.cursor_tracker.unsubscribe(self.update_cursor_widget_position)
             self.countdown_label.hide()
-            pos = pyautogui.position()
-            self.finalize_recording(self.recording_action, (pos.x, pos.y))
+            self.finalize_recording(self.recording_action, self.cursor_tracker.position)
 
-    def update_cursor_widget_position(self):
+    def update_cursor_widget_position(self, pos):
         if self.countdown_label:
-            pos = pyautogui.position()
             # Center the label on the cursor
-            self.countdown_label.move(pos.x - self.countdown_label.width() // 2, pos.y - self.countdown_label.height() // 2)
+            self.countdown_label.move(pos[0] - self.countdown_label.width() // 2, pos[1] - self.countdown_label.height() // 2)
 
     def finalize_recording(self, action, pos):
         self.save_recorded_action(action, pos)
@@ -309,28 +513,18 @@ class SkeuomorphicWindow(QMainWindow):
         self.update_status_label(f"Recorded '{action}' at {pos}")
 
     def load_config(self) -> dict:
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return self.get_default_config(and_save=True)
-        return self.get_default_config(and_save=True)
+        config = self.config_store.load()
+        if config is None:
+            return self.get_default_config(and_save=True)
+        return config
     
     def get_default_config(self, and_save=False) -> dict:
-        config = {
-            "actions": {"like": None, "bookmark": None, "follow": None,
-                "swipe_up": {"type": "swipe", "distance": -2000, "duration": 0.2},
-                "swipe_down": {"type": "swipe", "distance": 2000, "duration": 0.2}},
-            "sequence": [],
-            "settings": {"random_delay": True, "delay_range": [1, 5]}
-        }
+        config = default_config()
         if and_save: self.save_config(config)
         return config
     
     def save_config(self, config_data=None):
-        with open(self.config_file, 'w') as f:
-            json.dump(config_data if config_data else self.config, f, indent=2)
+        self.config_store.save(config_data if config_data else self.config)
 
     def update_action_labels(self):
         for action, data in self.config["actions"].items():
@@ -353,160 +547,188 @@ class SkeuomorphicWindow(QMainWindow):
         # Update swipe parameters from default config before generating sequence
         default_config = self.get_default_config()
         
-        # Update swipe_up and swipe_down with latest parameters from main.py
+        # Update swipe_up and swipe_down with latest parameters from engine.py
         if "swipe_up" in default_config["actions"]:
             self.config["actions"]["swipe_up"] = default_config["actions"]["swipe_up"]
         if "swipe_down" in default_config["actions"]:
             self.config["actions"]["swipe_down"] = default_config["actions"]["swipe_down"]
         
-        # Weighted random sequence generator
-        actions = [a for a, d in self.config["actions"].items() if d is not None]
-        if len(actions) < 5:
-            QMessageBox.warning(self, "Missing Actions", "Please record all actions first.")
+        generator = self.create_generator()
+        if generator is None:
             return
+        seq = generator.generate(self.config["settings"]["sequence_length"])
 
-        # Define weights for each action
-        weights_map = {
-            "swipe_down": 5,   
-            "swipe_up": 70,    
-            "like": 10,
-            "bookmark": 5,
-            "follow": 10
-        }
-        # Only include actions that are recorded
-        weights = [weights_map.get(a, 1) for a in actions]
-
-        seq = []
-        for _ in range(400):
-            action_name = random.choices(actions, weights=weights, k=1)[0]
-            action_type = self.config["actions"][action_name]["type"]
-            seq.append({"type": action_type, "name": action_name})
-
-        self.config["sequence"] = seq
+        self.config_store.set_sequence(seq)
         self.save_config()
         self.update_sequence_list()
         QMessageBox.information(self, "Success", f"Generated sequence with {len(seq)} steps! Updated swipe parameters.")
 
-    def update_sequence_list(self, highlight_index=None):
-        self.sequence_text.clear()
-        html = ""
-        for idx, action in enumerate(self.config["sequence"]):
-            name = action["name"].replace("_", " ").title()
-            if highlight_index is not None and idx == highlight_index:
-                html += f'<div style="background-color:#cce6ff;padding:2px 4px;border-radius:4px;">→ {name}</div>'
-            else:
-                html += f'<div>{name}</div>'
-        self.sequence_text.setHtml(html)
-
-    def update_coordinates(self):
-        pos = pyautogui.position()
-        self.coord_label.setText(f"Mouse: X: {pos.x}, Y: {pos.y}")
+    def create_generator(self):
+        """Build a generator from the configured weights, or warn and return None."""
+        try:
+            generator = create_generator(self.config)
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid Settings", str(e))
+            return None
+        if generator is None:
+            QMessageBox.warning(self, "Missing Actions", "Please record all actions first.")
+        return generator
+
+    def update_sequence_list(self):
+        started = time.perf_counter() if TELEMETRY.enabled else None
+        self.sequence_model.set_sequence(self.config_store.sequence)
+        if started is not None:
+            TELEMETRY.record("ui.update_sequence_list", time.perf_counter() - started, steps=len(self.config_store.sequence))
+
+    def highlight_sequence_step(self, index):
+        started = time.perf_counter() if TELEMETRY.enabled else None
+        model_index = self.sequence_model.set_highlight_row(index)
+        if model_index.isValid():
+            self.sequence_view.scrollTo(model_index, QAbstractItemView.ScrollHint.PositionAtCenter)
+        if started is not None:
+            TELEMETRY.record("ui.highlight", time.perf_counter() - started)
+
+    def update_coordinates(self, pos):
+        self.coord_label.setText(f"Mouse: X: {pos[0]}, Y: {pos[1]}")
         
     def update_status_label(self, message):
         self.status_label.setText(message)
 
-    def execute_action(self, action):
-        action_details = self.config["actions"][action["name"]]
-        if action["type"] == "click":
-            pos = action_details["pos"]
-            pyautogui.click(pos[0], pos[1])
-        elif action["type"] == "scroll":
-            pyautogui.scroll(action_details["amount"])
-        elif action["type"] == "swipe":
-            # To simulate a continuous trackpad swipe, we send a stream of small scroll events.
-            distance = action_details["distance"] # Total scroll amount (negative for up, positive for down)
-            duration = action_details["duration"] # How long the swipe should take
-
-            # We aim for a smooth gesture, similar to a 60Hz refresh rate.
-            num_steps = max(1, int(duration / 0.05))
-            scroll_per_step = distance / num_steps
-            delay_per_step = duration / num_steps
-
-            for _ in range(num_steps):
-                pyautogui.scroll(int(scroll_per_step))
-                time.sleep(delay_per_step)
-
-    def automation_loop(self):
-        for i in range(3, 0, -1):
-            if self.esc_pressed: break
-            self.signals.update_status.emit(f"Starting in {i}...")
-            time.sleep(1)
-        
-        sequence = self.config["sequence"].copy()
-        
-        while self.is_running and not self.esc_pressed:
-            for idx, action in enumerate(sequence):
-                if not self.is_running or self.esc_pressed: break
-                name = action['name'].replace('_', ' ').title()
-                self.signals.update_status.emit(f"Executing: {name}")
-                
-                # Highlight using the index from the sequence
-                self.signals.highlight_sequence_step.emit(idx)
-                self.execute_action(action)
-                delay = random.uniform(*self.config["settings"]["delay_range"])
-                start_time = time.time()
-                while time.time() - start_time < delay:
-                    if not self.is_running or self.esc_pressed: break
-                    remaining = delay - (time.time() - start_time)
-                    self.signals.update_status.emit(f"Next action in {remaining:.1f}s")
-                    time.sleep(0.1)
-            if self.esc_pressed: break
-        # Remove highlight at end
-        self.signals.highlight_sequence_step.emit(-1)
-        self.signals.automation_finished.emit()
+    def poll_status(self):
+        started = time.perf_counter() if TELEMETRY.enabled else None
+        snapshot = self.status_source.snapshot()
+        if snapshot.version != self.last_status_version:
+            self.last_status_version = snapshot.version
+            if started is not None and snapshot.published:
+                TELEMETRY.record("status.delivery", started - snapshot.published)
+            self.highlight_sequence_step(snapshot.index)
+        text = StatusChannel.describe(snapshot, time.monotonic())
+        if text and text != self.status_label.text():
+            self.update_status_label(text)
+        if started is not None:
+            TELEMETRY.record("ui.poll_status", time.perf_counter() - started)
+        # A child process has no Qt signals back to us, so notice its exit here
+        if self.process_runner is not None and not self.process_runner.is_alive():
+            self.on_automation_finished()
+
+    def toggle_telemetry(self):
+        if TELEMETRY.enabled:
+            TELEMETRY.disable()
+            self.update_status_label("Telemetry off.")
+        else:
+            settings = self.config["settings"].get("telemetry") or {}
+            TELEMETRY.enable(settings.get("trace_file"))
+            self.update_status_label("Telemetry on. Press Ctrl+Shift+I for a summary.")
+
+    def show_telemetry_summary(self):
+        summary = format_summary(TELEMETRY.summary())
+        box = QMessageBox(QMessageBox.Icon.Information, "Telemetry", f"<pre>{summary}</pre>", parent=self)
+        box.exec()
+
+    def automation_loop(self, generator=None):
+        # Always hand control back to the GUI, even if the backend fails mid-run
+        try:
+            self.engine.run(self.config_store.sequence, generator)
+        except Exception as e:
+            self.automation_error = f"{type(e).__name__}: {e}"
+        finally:
+            self.signals.automation_finished.emit()
     
     def start_automation(self):
-        if not self.config["sequence"]:
+        generator = None
+        if self.config["settings"].get("endless"):
+            generator = self.create_generator()
+            if generator is None:
+                return
+        elif not self.config_store.sequence:
             QMessageBox.warning(self, "No Sequence", "Please generate a sequence first!")
             return
+        problems = validate_config(self.config, self.config_store.sequence)
+        if problems:
+            QMessageBox.warning(self, "Invalid Configuration", "\n".join(problems))
+            return
+        self.automation_error = None
+        self.last_status_version = -1
+        # Ready whatever stop_automation() cancels before a hotkey can see is_running
+        if self.config["settings"].get("executor") == "process":
+            from process_runner import ProcessRunner
+            self.process_runner = ProcessRunner()
+            self.status_source = self.process_runner.status_channel
+        else:
+            self.engine.scheduler.reset()
+            self.status_source = self.engine.status_channel
         self.is_running = True
-        self.esc_pressed = False
         self.show_automation_view()
-        self.thread = threading.Thread(target=self.automation_loop, daemon=True)
-        self.thread.start()
+        if self.process_runner is not None:
+            self.process_runner.start(self.config, self.config_store.sequence, generator)
+        else:
+            self.thread = threading.Thread(target=self.automation_loop, args=(generator,), daemon=True)
+            self.thread.start()
+        self.status_timer.start()
     
     def stop_automation(self):
         if self.is_running:
-            self.esc_pressed = True
+            if self.process_runner is not None:
+                self.process_runner.stop()
+            else:
+                self.engine.scheduler.cancel()
 
     def on_automation_finished(self):
+        self.status_timer.stop()
+        # Remove highlight at end
+        self.highlight_sequence_step(-1)
         self.is_running = False
-        self.esc_pressed = False
         self.show_setup_view()
-        self.update_status_label("Automation stopped.")
+        if self.process_runner is not None:
+            self.process_runner.join()
+            drift = self.process_runner.drift_summary()
+            if self.process_runner.process.exitcode:
+                self.automation_error = f"executor exited with code {self.process_runner.process.exitcode}"
+            self.process_runner = None
+        else:
+            drift = self.engine.scheduler.drift_summary()
+        if self.automation_error:
+            self.update_status_label(f"Automation failed: {self.automation_error}")
+        else:
+            self.update_status_label(f"Automation stopped. {drift}" if drift else "Automation stopped.")
 
     def create_gradient_noise_background(self):
         width, height = self.size().width(), self.size().height()
         if width == 0 or height == 0: return
 
-        gradient = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(gradient)
-        for y in range(height):
-            ratio = y / height
-            r = int(245 * (1 - ratio) + 235 * ratio)
-            g = int(240 * (1 - ratio) + 230 * ratio)
-            b = int(235 * (1 - ratio) + 225 * ratio)
-            draw.line([(0, y), (width, y)], fill=(r, g, b))
-
-        noise = np.random.normal(0, 4, (height, width, 3)).astype(np.uint8)
-        noise_img = Image.fromarray(noise)
-        background_img = Image.blend(gradient, noise_img, 0.03)
-
-        qimage = ImageQt(background_img)
-        pixmap = QPixmap.fromImage(qimage)
+        started = time.perf_counter() if TELEMETRY.enabled else None
+        if self.background_renderer is None:
+            self.background_renderer = BackgroundRenderer()
+        pixmap = self.background_renderer.pixmap(width, height)
         self.background_label.setPixmap(pixmap)
+        if started is not None:
+            TELEMETRY.record("ui.background", time.perf_counter() - started, width=width, height=height)
         self.background_label.setGeometry(0, 0, width, height)
         self.background_label.lower()
 
     def resizeEvent(self, event):
-        self.create_gradient_noise_background()
+        width, height = event.size().width(), event.size().height()
+        self.background_label.setGeometry(0, 0, width, height)
+        if self.background_label.pixmap().isNull() and width and height:
+            # The first frame gets the plain gradient at once; the noise follows after the debounce
+            self.background_label.setPixmap(BackgroundRenderer.gradient_pixmap(width, height))
+            self.background_label.lower()
+        self.background_timer.start()
         super().resizeEvent(event)
     
     def closeEvent(self, event):
-        self.keyboard_listener.stop()
+        if self.hotkeys:
+            self.hotkeys.stop()
+        self.cursor_tracker.stop()
+        if self.process_runner is not None:
+            self.process_runner.shutdown()
+        self.config_store.flush()
+        TELEMETRY.disable()
         event.accept()
 
-    def show_setup_view(self):
+    def show_setup_view(self, track_cursor=True):
+        if track_cursor:
+            self.cursor_tracker.subscribe(self.update_coordinates)
         self.top_info_widget.show()
         self.recording_box.show()
         self.controls_widget.show()
@@ -516,18 +738,18 @@ class SkeuomorphicWindow(QMainWindow):
         self.stop_button.setVisible(False)
 
     def show_automation_view(self):
+        # The coordinates widget is hidden, so stop tracking the cursor for it
+        self.cursor_tracker.unsubscribe(self.update_coordinates)
         self.top_info_widget.hide()
         self.recording_box.hide()
         self.controls_widget.hide()
         self.sequence_box.show()
         self.stop_button.setVisible(True)
 
-if __name__ == "__main__":
+def require_accessibility_permission(app):
     # Check for Accessibility permission on macOS
     if not check_accessibility_permission():
-        from PyQt6.QtWidgets import QApplication, QMessageBox
         import subprocess
-        app = QApplication(sys.argv)
         QMessageBox.critical(
             None,
             "Accessibility Permission Required",
@@ -535,8 +757,23 @@ if __name__ == "__main__":
         )
         # Open Accessibility settings
         subprocess.run(["open", "x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility"])
-        sys.exit(1)
+        app.exit(1)
+
+def report_startup(imported_at):
+    shown_at = time.perf_counter()
+    print(f"Startup: imports {(imported_at - _STARTED_AT) * 1000:.0f} ms, "
+          f"window shown {(shown_at - _STARTED_AT) * 1000:.0f} ms", file=sys.stderr)
+
+if __name__ == "__main__":
+    import multiprocessing
+    # Lets the executor's child process start from a frozen (PyInstaller) build
+    multiprocessing.freeze_support()
+    imported_at = time.perf_counter()
     app = QApplication(sys.argv)
     window = SkeuomorphicWindow()
     window.show()
+    if "--timing" in sys.argv or os.environ.get("TTWARMUP_TIMING"):
+        QTimer.singleShot(0, lambda: report_startup(imported_at))
+    # The permission probe moves the mouse, so run it after the window is on screen
+    QTimer.singleShot(0, lambda: require_accessibility_permission(app))
     sys.exit(app.exec()) 
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""Run the execution engine in a dedicated child process.
+
+The child owns its own interpreter and GIL, so Qt painting, the pynput
+listeners and background rendering in the GUI process cannot delay an
+action. Status flows back through a StatusRing in shared memory instead
+of Qt signals, and stopping is a multiprocessing.Event that the child's
+scheduler waits on directly, so it wakes the moment the flag is set.
+
+The child collects its own telemetry into a separate trace file and
+sends its histograms back over a pipe when the run ends.
+"""
+import os
+import math
+import time
+import ctypes
+import struct
+import threading
+import multiprocessing
+from engine import AutomationEngine, StatusChannel, StatusSnapshot, StepScheduler
+from telemetry import TELEMETRY
+
+class StatusRing:
+    """Fixed-size ring of status records in shared memory.
+
+    There is exactly one writer (the child). Each slot carries a sequence
+    number that is odd while the slot is being written, so readers can
+    detect and skip a torn read. `snapshot()` has the same latest-value
+    semantics as StatusChannel. Records are stamped with perf_counter(),
+    which reads a system-wide clock, so the GUI can time their delivery.
+    """
+    HEADER = struct.Struct("<Qqdd")  # records written, drift count, drift total, drift max
+    RECORD = struct.Struct("<QBqdd48s")  # slot sequence, phase, index, deadline, published, label
+    PHASES = (StatusChannel.IDLE, StatusChannel.STARTING, StatusChannel.EXECUTING, StatusChannel.WAITING)
+
+    def __init__(self, buffer, slots):
+        self._buffer = buffer
+        self.slots = slots
+        self._phase_ids = {phase: i for i, phase in enumerate(self.PHASES)}
+        self._last = StatusSnapshot(0, StatusChannel.IDLE, -1, None, "", 0.0)
+
+    @classmethod
+    def allocate(cls, context, slots=64):
+        return context.RawArray(ctypes.c_ubyte, cls.HEADER.size + slots * cls.RECORD.size)
+
+    def _offset(self, version):
+        return self.HEADER.size + ((version - 1) % self.slots) * self.RECORD.size
+
+    def publish(self, phase, index=-1, deadline=None, label=""):
+        version = self.HEADER.unpack_from(self._buffer, 0)[0] + 1
+        offset = self._offset(version)
+        deadline = math.nan if deadline is None else deadline
+        label = label.encode("utf-8")[:48]
+        self.RECORD.pack_into(self._buffer, offset, 2 * version - 1, self._phase_ids[phase], index,
+                              deadline, time.perf_counter(), label)
+        struct.pack_into("<Q", self._buffer, offset, 2 * version)
+        struct.pack_into("<Q", self._buffer, 0, version)
+
+    def _read(self, version):
+        offset = self._offset(version)
+        sequence, phase, index, deadline, published, label = self.RECORD.unpack_from(self._buffer, offset)
+        # A changed or odd sequence means the slot was overwritten or is mid-write
+        if sequence != 2 * version or struct.unpack_from("<Q", self._buffer, offset)[0] != sequence:
+            return None
+        return StatusSnapshot(version, self.PHASES[phase], index, None if math.isnan(deadline) else deadline,
+                              label.rstrip(b"\0").decode("utf-8", "replace"), published)
+
+    def snapshot(self):
+        for _ in range(4):
+            version = self.HEADER.unpack_from(self._buffer, 0)[0]
+            if version == 0:
+                break
+            snapshot = self._read(version)
+            if snapshot is not None:
+                self._last = snapshot
+                break
+        return self._last
+
+    def set_drift(self, scheduler):
+        version = self.HEADER.unpack_from(self._buffer, 0)[0]
+        self.HEADER.pack_into(self._buffer, 0, version, scheduler.drift_count,
+                              scheduler.drift_total, scheduler.drift_max)
+
+    def drift_summary(self):
+        _, count, total, maximum = self.HEADER.unpack_from(self._buffer, 0)
+        return StepScheduler.format_drift(count, total, maximum)
+
+class ProcessRunner:
+    """Starts and stops one engine run in a spawned child process."""
+    def __init__(self, slots=64):
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._buffer = StatusRing.allocate(self._context, slots)
+        self.status_channel = StatusRing(self._buffer, slots)
+        self._results, self._results_writer = self._context.Pipe(duplex=False)
+        self.process = None
+
+    def start(self, config, sequence, generator=None, countdown=3):
+        self.process = self._context.Process(
+            target=_run_child,
+            args=(self._buffer, self.status_channel.slots, self._stop_event, self._results_writer,
+                  child_telemetry(config["settings"].get("telemetry")), config, sequence, generator, countdown),
+            name="ttwarmup-executor", daemon=True)
+        self.process.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def is_alive(self):
+        return self.process is not None and self.process.is_alive()
+
+    def join(self, timeout=None):
+        if self.process is not None:
+            self.process.join(timeout)
+            # The child sends its histograms just before it exits
+            if not self.process.is_alive() and self._results.poll():
+                TELEMETRY.merge(self._results.recv())
+
+    def shutdown(self, timeout=2.0):
+        """Stop the child and wait for it, killing it if it does not exit in time."""
+        self.stop()
+        self.join(timeout)
+        if self.is_alive():
+            self.process.terminate()
+            self.join()
+
+    def drift_summary(self):
+        return self.status_channel.drift_summary()
+
+def child_telemetry(settings):
+    """Telemetry settings for the executor: on if it is on here, traced to its own file."""
+    settings = dict(settings or {})
+    settings["enabled"] = TELEMETRY.enabled
+    if settings.get("trace_file"):
+        root, ext = os.path.splitext(settings["trace_file"])
+        settings["trace_file"] = f"{root}.executor{ext}"
+    return settings
+
+def _watch_parent(stop_event):
+    # Stop cleanly if the GUI process exits or crashes
+    parent = multiprocessing.parent_process()
+    if parent is not None:
+        parent.join()
+        stop_event.set()
+
+def _run_child(buffer, slots, stop_event, results, telemetry, config, sequence, generator, countdown):
+    TELEMETRY.configure(telemetry)
+    ring = StatusRing(buffer, slots)
+    scheduler = StepScheduler(cancel_event=stop_event)
+    engine = AutomationEngine(config, scheduler=scheduler)
+    engine.status_channel = ring
+    threading.Thread(target=_watch_parent, args=(stop_event,), daemon=True).start()
+    try:
+        engine.run(sequence, generator, countdown=countdown)
+    finally:
+        ring.set_drift(scheduler)
+        TELEMETRY.disable()
+        results.send(TELEMETRY.histograms)
+        ring.publish(StatusChannel.IDLE)
@@ -0,0 +1,83 @@
+"""Replay a run against a virtual clock and a recording input backend.
+
+The real AutomationEngine executes the sequence, but every wait jumps
+straight to its deadline, so a multi-hour run finishes in milliseconds
+and yields a timeline plus summary statistics.
+"""
+import random
+from collections import Counter, namedtuple
+from engine import AutomationEngine, StepScheduler, VirtualClock
+from input_backends import RecordingBackend
+
+class SimulatedStep(namedtuple("SimulatedStep", "index name start action_time delay")):
+    """One executed step; times are seconds from the start of the run."""
+    __slots__ = ()
+
+class SimulationReport:
+    def __init__(self, timeline, events, duration, delay_range):
+        self.timeline = timeline
+        self.events = events
+        self.duration = duration
+        self.delay_range = delay_range
+
+    def summary(self, bins=10):
+        delays = sorted(step.delay for step in self.timeline)
+        low, high = self.delay_range
+        width = (high - low) / bins or 1
+        histogram = [0] * bins
+        for delay in delays:
+            histogram[min(bins - 1, int((delay - low) / width))] += 1
+        return {
+            "steps": len(self.timeline),
+            "total_duration": self.duration,
+            "action_counts": dict(Counter(step.name for step in self.timeline)),
+            "input_events": dict(Counter(kind for _, kind, _ in self.events)),
+            "action_time_total": sum(step.action_time for step in self.timeline),
+            "delay": {
+                "min": delays[0] if delays else 0.0,
+                "mean": sum(delays) / len(delays) if delays else 0.0,
+                "median": delays[len(delays) // 2] if delays else 0.0,
+                "max": delays[-1] if delays else 0.0,
+                "histogram": {"low": low, "high": high, "counts": histogram},
+            },
+        }
+
+    def format_summary(self):
+        summary = self.summary()
+        hours, rest = divmod(summary["total_duration"], 3600)
+        minutes, seconds = divmod(rest, 60)
+        delay = summary["delay"]
+        lines = [
+            f"Steps: {summary['steps']}",
+            f"Total duration: {int(hours)}h {int(minutes)}m {seconds:.1f}s",
+            f"Time in actions: {summary['action_time_total']:.1f}s",
+            "Actions: " + ", ".join(f"{name} {count}" for name, count in sorted(summary["action_counts"].items())),
+            "Input events: " + ", ".join(f"{kind} {count}" for kind, count in sorted(summary["input_events"].items())),
+            f"Delay: min {delay['min']:.2f}s, mean {delay['mean']:.2f}s, median {delay['median']:.2f}s, max {delay['max']:.2f}s",
+        ]
+        peak = max(delay["histogram"]["counts"]) or 1
+        width = (delay["histogram"]["high"] - delay["histogram"]["low"]) / len(delay["histogram"]["counts"])
+        for i, count in enumerate(delay["histogram"]["counts"]):
+            start = delay["histogram"]["low"] + i * width
+            lines.append(f"  {start:6.2f}-{start + width:<6.2f} {'#' * round(30 * count / peak)} {count}")
+        return "\n".join(lines)
+
+def simulate(config, sequence, generator=None, seed=None, countdown=3, max_steps=None):
+    """Run one pass over `sequence` (or `max_steps` endless steps) in virtual time."""
+    clock = VirtualClock()
+    scheduler = StepScheduler(clock)
+    backend = RecordingBackend(max_events=None, clock=clock.now)
+    timeline = []
+
+    def on_step(index, name, started, target):
+        delay = target - clock.now()
+        timeline.append(SimulatedStep(index, name, started, clock.now() - started, delay))
+        if max_steps is not None and len(timeline) >= max_steps:
+            scheduler.cancel()
+
+    engine = AutomationEngine(config, backend, scheduler, random.Random(seed), on_step)
+    engine.run(sequence, generator, repeat=False, countdown=countdown)
+    # A run ends after the delay that follows its last step
+    last = timeline[-1] if timeline else None
+    duration = last.start + last.action_time + last.delay if last else clock.now()
+    return SimulationReport(timeline, list(backend.events), duration, config["settings"]["delay_range"])
@@ -0,0 +1,185 @@
+"""Lightweight latency telemetry for the engine and the GUI hot paths.
+
+Call sites check `TELEMETRY.enabled` before taking any timestamps, so
+instrumentation costs one attribute read while it is switched off.
+When on, every sample goes into a fixed-size log-bucket histogram and,
+if a trace file is configured, is appended as one JSON line to a
+size-rotated trace.
+"""
+import os
+import json
+import time
+import threading
+from bisect import bisect_left
+
+# Bucket upper bounds from 1 us to 100 s, four per decade
+BUCKET_BOUNDS = [1e-6 * 10 ** (i / 4) for i in range(33)]
+
+class Histogram:
+    """Fixed-memory latency histogram over BUCKET_BOUNDS (seconds)."""
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def record(self, value):
+        self.counts[bisect_left(BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for i, bucket_count in enumerate(other.counts):
+            self.counts[i] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (0-100)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(BUCKET_BOUNDS[i], self.max) if i < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def summary(self):
+        if not self.count:
+            return {"count": 0}
+        return {"count": self.count, "mean": self.total / self.count, "min": self.min,
+                "p50": self.percentile(50), "p90": self.percentile(90), "p99": self.percentile(99), "max": self.max}
+
+class TraceWriter:
+    """Appends JSON lines to `path`, rotating to path.1 .. path.N at `max_bytes`.
+
+    Writes after `close()` are dropped, and an I/O error (a full disk, say)
+    closes the trace instead of raising into the thread being measured.
+    """
+    def __init__(self, path, max_bytes=5_000_000, backups=3):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self._file = open(path, "a", buffering=64 * 1024)
+
+    def write(self, record):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.write(line)
+                if self._file.tell() >= self.max_bytes:
+                    self._rotate()
+            except (OSError, ValueError):
+                self._close()
+
+    def _rotate(self):
+        self._file.close()
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        self._file = open(self.path, "w", buffering=64 * 1024)
+
+    def _close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass  # unflushed lines are lost, which beats failing the caller
+            self._file = None
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+class Telemetry:
+    """Process-wide switchable collector; use the TELEMETRY instance."""
+    def __init__(self):
+        self.enabled = False
+        self.histograms = {}
+        self._trace = None
+        self._lock = threading.Lock()
+
+    def configure(self, settings):
+        """Apply a settings.telemetry dict from the config."""
+        settings = settings or {}
+        if settings.get("enabled"):
+            self.enable(settings.get("trace_file"), settings.get("max_bytes", 5_000_000), settings.get("backups", 3))
+        else:
+            self.disable()
+
+    def enable(self, trace_file=None, max_bytes=5_000_000, backups=3):
+        with self._lock:
+            if self._trace is None and trace_file:
+                try:
+                    self._trace = TraceWriter(trace_file, max_bytes, backups)
+                except OSError:
+                    pass  # keep the histograms even if the trace cannot be opened
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        with self._lock:
+            if self._trace is not None:
+                self._trace.close()
+                self._trace = None
+
+    def record(self, name, seconds, **fields):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms.setdefault(name, Histogram())
+        histogram.record(seconds)
+        trace = self._trace
+        if trace is not None:
+            trace.write({"t": time.time(), "name": name, "value": seconds, **fields})
+
+    def merge(self, histograms):
+        """Add histograms collected elsewhere, e.g. in the executor process."""
+        for name, histogram in histograms.items():
+            self.histograms.setdefault(name, Histogram()).merge(histogram)
+
+    def reset(self):
+        self.histograms = {}
+
+    def summary(self):
+        return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+
+def format_summary(summary):
+    lines = [f"{'metric':<28}{'count':>8}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}  (ms)"]
+    for name, stats in summary.items():
+        if not stats["count"]:
+            continue
+        values = "".join(f"{stats[key] * 1000:>10.2f}" for key in ("mean", "p50", "p90", "p99", "max"))
+        lines.append(f"{name:<28}{stats['count']:>8}{values}")
+    return "\n".join(lines)
+
+def summarize_trace(path):
+    """Rebuild histograms from a trace file and its rotated backups."""
+    histograms = {}
+    paths = [path] + [f"{path}.{i}" for i in range(1, 100) if os.path.exists(f"{path}.{i}")]
+    for trace_path in paths:
+        if not os.path.exists(trace_path):
+            continue
+        with open(trace_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # a line cut short by a crash
+                histograms.setdefault(record["name"], Histogram()).record(record["value"])
+    return {name: histogram.summary() for name, histogram in sorted(histograms.items())}
+
+TELEMETRY = Telemetry()
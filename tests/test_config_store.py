@@ -0,0 +1,61 @@
+import json
+import threading
+from engine import ActionSequence, ConfigStore
+
+class GatedLock:
+    """A lock that holds up the store's writer thread the first time it is taken."""
+    def __init__(self, store):
+        self._lock = threading.Lock()
+        self._store = store
+        self.waiting = threading.Event()
+        self.release = threading.Event()
+        self.writer_done = threading.Event()
+
+    def _is_writer(self):
+        return threading.current_thread() is self._store._writer
+
+    def __enter__(self):
+        if self._is_writer() and not self.waiting.is_set():
+            self.waiting.set()
+            self.release.wait(5)
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self._lock.release()
+        if self._is_writer():
+            self.writer_done.set()
+
+def read(path):
+    with open(path) as f:
+        return json.load(f)
+
+def test_flush_writes_pending_changes(tmp_path):
+    store = ConfigStore(tmp_path / "config.json", tmp_path / "sequence.json", debounce=60)
+    store.save({"settings": {"v": 1}})
+    store.set_sequence(ActionSequence(["like", "swipe_up", "swipe_up"]))
+    store.flush()
+    assert read(tmp_path / "config.json") == {"settings": {"v": 1}}
+    assert list(store.sequence) == ["like", "swipe_up", "swipe_up"]
+
+def test_save_snapshots_the_config(tmp_path):
+    store = ConfigStore(tmp_path / "config.json", tmp_path / "sequence.json", debounce=60)
+    config = {"settings": {"v": 1}}
+    store.save(config)
+    config["settings"]["v"] = 2
+    store.flush()
+    assert read(tmp_path / "config.json") == {"settings": {"v": 1}}
+
+def test_older_snapshot_never_overwrites_a_newer_flush(tmp_path):
+    store = ConfigStore(tmp_path / "config.json", tmp_path / "sequence.json", debounce=0)
+    store._write_lock = gate = GatedLock(store)
+    store.save({"v": "old"})
+    # The writer thread is now due and held just before it writes
+    assert gate.waiting.wait(5)
+    store.save({"v": "new"})
+    flusher = threading.Thread(target=store.flush)
+    flusher.start()
+    flusher.join(5)
+    gate.release.set()
+    assert gate.writer_done.wait(5)
+    assert read(tmp_path / "config.json") == {"v": "new"}
@@ -0,0 +1,31 @@
+import json
+from engine import ActionSequence, StepScheduler, VirtualClock
+
+def test_sequence_json_round_trip():
+    names = ["swipe_up"] * 50 + ["like", "swipe_down", "swipe_down", "follow"] + ["swipe_up"] * 10
+    sequence = ActionSequence(names)
+    data = json.loads(json.dumps(sequence.to_json()))
+    assert list(ActionSequence.from_json(data)) == names
+
+def test_sequence_runs_are_run_length_encoded():
+    sequence = ActionSequence(["swipe_up"] * 1000 + ["like"] + ["swipe_up"] * 1000)
+    assert sequence.to_json() == {"names": ["swipe_up", "like"], "runs": [0, 1000, 1, 1, 0, 1000]}
+
+def test_sequence_reads_the_older_plain_name_list():
+    assert list(ActionSequence.from_json({"steps": ["like", "follow"]})) == ["like", "follow"]
+
+def test_sequence_labels():
+    sequence = ActionSequence(["swipe_up", "like"])
+    assert [sequence.label(i) for i in range(len(sequence))] == ["Swipe Up", "Like"]
+
+def test_cancelled_scheduler_stops_waiting_without_advancing_time():
+    clock = VirtualClock()
+    scheduler = StepScheduler(clock)
+    assert scheduler.wait_until(5)
+    assert clock.now() == 5
+    scheduler.cancel()
+    assert not scheduler.wait_until(10)
+    assert scheduler.wait_step(10) is None
+    assert clock.now() == 5
+    scheduler.reset()
+    assert scheduler.wait_step(7) == 0
@@ -0,0 +1,46 @@
+import multiprocessing
+from engine import StatusChannel, StepScheduler, VirtualClock
+from process_runner import StatusRing
+
+def make_ring(slots=4):
+    return StatusRing(StatusRing.allocate(multiprocessing.get_context("spawn"), slots), slots)
+
+def test_snapshot_starts_idle():
+    snapshot = make_ring().snapshot()
+    assert (snapshot.version, snapshot.phase, snapshot.index) == (0, StatusChannel.IDLE, -1)
+
+def test_snapshot_returns_the_latest_record():
+    ring = make_ring()
+    ring.publish(StatusChannel.STARTING, deadline=12.5)
+    ring.publish(StatusChannel.EXECUTING, 3, label="Swipe Up")
+    snapshot = ring.snapshot()
+    assert (snapshot.version, snapshot.phase, snapshot.index, snapshot.label) == (2, StatusChannel.EXECUTING, 3, "Swipe Up")
+    assert snapshot.deadline is None
+    assert snapshot.published > 0
+
+def test_snapshot_survives_wrapping_the_ring():
+    ring = make_ring(slots=4)
+    for index in range(10):
+        ring.publish(StatusChannel.WAITING, index, deadline=float(index))
+    snapshot = ring.snapshot()
+    assert (snapshot.version, snapshot.index, snapshot.deadline) == (10, 9, 9.0)
+
+def test_torn_slot_falls_back_to_the_last_good_snapshot():
+    ring = make_ring()
+    ring.publish(StatusChannel.EXECUTING, 1)
+    assert ring.snapshot().index == 1
+    ring.publish(StatusChannel.EXECUTING, 2)
+    # Mark the newest slot as mid-write, as the writer does before filling it
+    offset = ring._offset(2)
+    ring.RECORD.pack_into(ring._buffer, offset, 3, 2, 2, 0.0, 0.0, b"")
+    assert ring.snapshot().index == 1
+
+def test_drift_stats_round_trip_through_the_header():
+    ring = make_ring()
+    ring.publish(StatusChannel.EXECUTING, 1)
+    scheduler = StepScheduler(VirtualClock())
+    for target in (1.0, 2.0, 3.0):
+        scheduler.wait_step(target)
+    ring.set_drift(scheduler)
+    assert ring.drift_summary() == scheduler.drift_summary()
+    assert ring.snapshot().version == 1
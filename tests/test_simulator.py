@@ -0,0 +1,69 @@
+import pytest
+from engine import ActionSequence, create_generator, default_config
+from simulator import simulate
+
+SWIPE_DURATION = 0.2
+DELAY_RANGE = [1, 5]
+
+@pytest.fixture
+def config():
+    config = default_config()
+    for i, action in enumerate(("like", "bookmark", "follow")):
+        config["actions"][action] = {"type": "click", "pos": [100 + i, 200 + i]}
+    config["settings"]["delay_range"] = list(DELAY_RANGE)
+    return config
+
+@pytest.fixture
+def sequence():
+    return ActionSequence(["swipe_up", "like", "swipe_up", "swipe_down", "bookmark", "follow"] * 5)
+
+def test_runs_every_step_once(config, sequence):
+    report = simulate(config, sequence, seed=1)
+    assert [step.index for step in report.timeline] == list(range(len(sequence)))
+    assert [step.name for step in report.timeline] == list(sequence)
+    assert report.summary()["action_counts"] == {"swipe_up": 10, "like": 5, "swipe_down": 5, "bookmark": 5, "follow": 5}
+
+def test_swipes_scroll_their_full_distance_over_their_duration(config, sequence):
+    report = simulate(config, sequence, seed=1)
+    scrolls = [args[0] for _, kind, args in report.events if kind == "scroll"]
+    distances = {name: config["actions"][name]["distance"] for name in ("swipe_up", "swipe_down")}
+    assert sum(scrolls) == sum(distances[name] for name in sequence if name in distances)
+    # 0.2 s at the default 50 ms step interval is four scroll events per swipe
+    assert len(scrolls) == 4 * 15
+    for step in report.timeline:
+        expected = SWIPE_DURATION if step.name in distances else 0.0
+        assert step.action_time == pytest.approx(expected)
+
+def test_clicks_go_to_the_recorded_positions(config, sequence):
+    report = simulate(config, sequence, seed=1)
+    clicks = [args for _, kind, args in report.events if kind == "click"]
+    positions = {name: tuple(config["actions"][name]["pos"]) for name in ("like", "bookmark", "follow")}
+    assert clicks == [positions[name] for name in sequence if name in positions]
+
+def test_delays_and_total_duration(config, sequence):
+    report = simulate(config, sequence, seed=1, countdown=3)
+    assert all(DELAY_RANGE[0] <= step.delay <= DELAY_RANGE[1] for step in report.timeline)
+    assert report.timeline[0].start == pytest.approx(3)
+    for previous, step in zip(report.timeline, report.timeline[1:]):
+        assert step.start == pytest.approx(previous.start + previous.action_time + previous.delay)
+    expected = 3 + sum(step.action_time + step.delay for step in report.timeline)
+    assert report.duration == pytest.approx(expected)
+
+def test_same_seed_gives_the_same_timeline(config, sequence):
+    assert simulate(config, sequence, seed=7).timeline == simulate(config, sequence, seed=7).timeline
+    assert simulate(config, sequence, seed=7).timeline != simulate(config, sequence, seed=8).timeline
+
+def test_cancelling_stops_the_run(config, sequence):
+    report = simulate(config, sequence, seed=1, max_steps=4)
+    assert len(report.timeline) == 4
+    # Nothing is sent after the step that cancelled the run
+    last = report.timeline[-1]
+    assert all(time <= last.start + last.action_time for time, _, _ in report.events)
+
+def test_endless_mode_draws_steps_until_cancelled(config):
+    pytest.importorskip("numpy")
+    config["settings"].update(endless=True, seed=3)
+    report = simulate(config, ActionSequence(), create_generator(config), seed=1, max_steps=200)
+    assert len(report.timeline) == 200
+    again = simulate(config, ActionSequence(), create_generator(config), seed=1, max_steps=200)
+    assert [step.name for step in report.timeline] == [step.name for step in again.timeline]